@@ -0,0 +1,36 @@
+from django.core.cache import cache
+import logging
+
+logger = logging.getLogger(__name__)
+
+INDEX_CACHE_VERSION_KEY = 'index_cache_version'
+
+
+def get_index_cache_version():
+    """
+    Get the current version of the cached homepage election data.
+    
+    Returns:
+        int: Version number used in the homepage cache key
+    """
+    return cache.get_or_set(INDEX_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def bump_index_cache_version():
+    """
+    Invalidate cached homepage election data by moving to a new key.
+    
+    The version lives in the default cache, so the bump is only seen by every
+    process when CACHE_URL points at a shared backend such as Redis. With the
+    local memory default, other processes keep serving their copy until it
+    expires.
+    
+    Returns:
+        int: The new version number
+    """
+    try:
+        return cache.incr(INDEX_CACHE_VERSION_KEY)
+    except ValueError:
+        # Key missing or evicted; start a fresh version sequence
+        cache.set(INDEX_CACHE_VERSION_KEY, 2, timeout=None)
+        return 2
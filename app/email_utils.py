@@ -1,5 +1,7 @@
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, send_mail
 from django.conf import settings
+from django.contrib.sites.models import Site
+from django.template.loader import render_to_string
 import logging
 
 logger = logging.getLogger(__name__)
@@ -147,6 +149,68 @@ def send_vote_confirmation(user, election):
         return False
 
 
+def get_invitation_base_url():
+    """
+    Get the scheme and domain that invitation links are built on.
+    
+    Returns:
+        str: Base URL such as 'https://example.com'
+    """
+    current_site = Site.objects.get_current()
+    # Use https in production, http for development
+    protocol = 'https' if getattr(settings, 'USE_TLS', not settings.DEBUG) else 'http'
+    return f"{protocol}://{current_site.domain}"
+
+
+def send_invitation_email(invitation, connection=None, base_url=None):
+    """
+    Send invitation email to the invited user.
+    
+    Args:
+        invitation: Invitation object with its election and invited_by loaded
+        connection: Optional open mail connection to reuse across a batch
+        base_url: Optional precomputed result of get_invitation_base_url()
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    try:
+        # Build the invitation URL using Django sites framework
+        if base_url is None:
+            base_url = get_invitation_base_url()
+        full_url = f"{base_url}{invitation.get_invitation_url()}"
+        
+        # Prepare email context
+        context = {
+            'invitation': invitation,
+            'election': invitation.election,
+            'invitation_url': full_url,
+            'invited_by': invitation.invited_by,
+        }
+        
+        # Render email templates
+        subject = f'Invitation to vote in "{invitation.election.name}"'
+        text_content = render_to_string('app/emails/invitation_email.txt', context)
+        html_content = render_to_string('app/emails/invitation_email.html', context)
+        
+        # Send email
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[invitation.invited_email],
+            connection=connection,
+        )
+        email.attach_alternative(html_content, 'text/html')
+        email.send(fail_silently=False)
+        
+        return True
+        
+    except Exception:
+        logger.exception("Failed to send invitation email for invitation %s", invitation.pk)
+        return False
+
+
 def test_email_configuration():
     """
     Test the email configuration by sending a test email.
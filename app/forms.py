@@ -1,5 +1,6 @@
 from django import forms
-from django.contrib.auth.models import User
+from django.contrib.auth.models import User, Group
+from django.db.models import Exists, OuterRef
 from app.models import Election, Candidate, Party, Invitation
 from django.core.exceptions import ValidationError
 from datetime import timedelta
@@ -204,13 +205,13 @@ class CandidateForm(forms.ModelForm):
             
             # Filter the queryset to exclude existing candidates
             available_users = User.objects.filter(
+                Exists(Group.objects.filter(name='Candidates', user=OuterRef('pk'))),
                 is_active=True,
-                groups__name='Candidates'
-            ).exclude(id__in=existing_candidate_users).distinct()
+            ).exclude(id__in=existing_candidate_users)
             
             self.fields['user'].queryset = available_users
             
-            if available_users.count() == 0:
+            if not available_users.exists():
                 if existing_candidate_users:
                     self.fields['user'].help_text = "⚠️ All available candidates are already assigned to this election."
                 else:
@@ -218,11 +219,11 @@ class CandidateForm(forms.ModelForm):
         else:
             # Fallback for when no election is provided
             candidate_users = User.objects.filter(
+                Exists(Group.objects.filter(name='Candidates', user=OuterRef('pk'))),
                 is_active=True,
-                groups__name='Candidates'
-            ).distinct()
+            )
             
-            if candidate_users.count() == 0:
+            if not candidate_users.exists():
                 self.fields['user'].help_text = "⚠️ No candidates available. Create users and add them to 'Candidates' group first."
 
     def clean_user(self):
@@ -333,25 +334,25 @@ class InvitationForm(forms.ModelForm):
         expires_in_days = self.cleaned_data['expires_in_days']
         message = self.cleaned_data.get('message', '')
         
-        invitations = []
-        for email in emails:
-            # Check if user exists with this email
-            try:
-                invited_user = User.objects.get(email=email)
-            except User.DoesNotExist:
-                invited_user = None
-            
-            invitation = Invitation.objects.create(
+        # Look up existing accounts for all emails in one query
+        users_by_email = {user.email: user for user in User.objects.filter(email__in=emails)}
+        expires_at = timezone.now() + timedelta(days=expires_in_days)
+        
+        invitations = [
+            Invitation(
                 election=self.election,
-                invited_user=invited_user,
+                invited_user=users_by_email.get(email),
                 invited_email=email,
                 invited_by=invited_by_user,
                 message=message,
-                expires_at=timezone.now() + timedelta(days=expires_in_days)
+                expires_at=expires_at
             )
-            invitations.append(invitation)
+            for email in emails
+        ]
         
-        return invitations
+        # Conflicts are not ignored: clean_invited_emails already rejects existing
+        # invitations, and the created rows need their primary keys for emailing
+        return Invitation.objects.bulk_create(invitations, batch_size=500)
 
 
 class InvitationResponseForm(forms.Form):
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(fields=['start_date', 'end_date'], name='election_window_idx'),
+        ),
+    ]
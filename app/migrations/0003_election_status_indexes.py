@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_election_window_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(fields=['closed_at', 'start_date', 'end_date'], name='election_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(fields=['created_by', 'closed_at'], name='election_creator_idx'),
+        ),
+    ]
@@ -1,14 +1,47 @@
 """
 Election model for managing elections in the voting system
 """
+import json
 import uuid
 from django.db import models
+from django.db.models import Case, IntegerField, Q, Value, When
 from django.contrib.auth.models import User
+from django.utils.functional import cached_property
+
+
+class ElectionQuerySet(models.QuerySet):
+    """QuerySet with database-side equivalents of the Election status helpers"""
+    
+    def with_status(self, now=None):
+        """
+        Annotate each election with ``status_code`` computed in SQL.
+        
+        Mirrors the grouping used for display: ongoing ('open'), upcoming
+        ('scheduled'/'inactive') and closed ('closed'/'expired').
+        """
+        from django.utils import timezone
+        now = now or timezone.now()
+        return self.annotate(
+            status_code=Case(
+                When(closed_at__isnull=False, then=Value(Election.STATUS_CLOSED)),
+                When(active=False, end_date__lt=now, then=Value(Election.STATUS_CLOSED)),
+                When(active=False, then=Value(Election.STATUS_UPCOMING)),
+                When(start_date__gt=now, then=Value(Election.STATUS_UPCOMING)),
+                When(end_date__lt=now, then=Value(Election.STATUS_CLOSED)),
+                default=Value(Election.STATUS_ONGOING),
+                output_field=IntegerField(),
+            )
+        )
 
 
 class Election(models.Model):
     """Model representing an election with its details and status"""
     
+    # Status groups used by ElectionQuerySet.with_status(), in display order
+    STATUS_ONGOING = 0
+    STATUS_UPCOMING = 1
+    STATUS_CLOSED = 2
+    
     uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True, db_index=True)
     name = models.CharField(max_length=100)
     start_date = models.DateTimeField()
@@ -39,6 +72,8 @@ class Election(models.Model):
     # Election lifecycle timestamps
     started_at = models.DateTimeField(null=True, blank=True, help_text="When the election was activated")
     closed_at = models.DateTimeField(null=True, blank=True, help_text="When the election was closed")
+    
+    objects = ElectionQuerySet.as_manager()
 
     def __str__(self):
         return self.name
@@ -122,8 +157,8 @@ class Election(models.Model):
     def can_be_edited_by(self, user):
         """Check if a user can edit this election"""
         return (user.is_superuser or 
-                self.created_by == user or 
-                user.groups.filter(name='Officials').exists())
+                self.created_by_id == user.pk or 
+                'Officials' in user.get_group_names())
     
     def can_be_started(self):
         """Check if this election can be started"""
@@ -161,15 +196,16 @@ class Election(models.Model):
         if self.is_public:
             # Public election - any authenticated user can vote
             return True
-        else:
-            # Private election - user must be invited
-            return self.invitations.filter(
-                invited_user=user,
-                status='accepted'
-            ).exists() or self.invitations.filter(
-                invited_email=user.email,
+        
+        # Private election - user must be invited; the answer is memoized per
+        # user so repeated checks within a request share one EXISTS query
+        cache = self.__dict__.setdefault('_can_user_vote_cache', {})
+        if user.pk not in cache:
+            cache[user.pk] = self.invitations.filter(
+                Q(invited_user=user) | Q(invited_email=user.email),
                 status='accepted'
             ).exists()
+        return cache[user.pk]
     
     def get_pending_invitations_count(self):
         """Get count of pending invitations"""
@@ -183,12 +219,16 @@ class Election(models.Model):
         """Get display-friendly privacy status"""
         return "Public Election" if self.is_public else "Private Election"
     
+    @cached_property
+    def parsed_public_key(self):
+        """Public key as a dict with 'g' and 'n', parsed once per instance"""
+        return json.loads(self.public_key.replace("'", '"'))
+    
     def get_results(self):
         if not self.can_show_results():
             return None
 
         from collections import defaultdict
-        import json
         from app.encryption import Encryption
 
         votes = self.votes.all()
@@ -202,7 +242,7 @@ class Election(models.Model):
         total_valid_votes = 0
 
         try:
-            public_key = json.loads(self.public_key.replace("'", '"'))
+            public_key = self.parsed_public_key
             private_key = json.loads(self.private_key.replace("'", '"'))
             encryption = Encryption(
                 public_key=f"{public_key['g']},{public_key['n']}",
@@ -260,4 +300,12 @@ class Election(models.Model):
     class Meta:
         ordering = ['-created']
         verbose_name = "Election"
-        verbose_name_plural = "Elections"
\ No newline at end of file
+        verbose_name_plural = "Elections"
+        indexes = [
+            # Voting window lookups used by the status filters
+            models.Index(fields=['start_date', 'end_date'], name='election_window_idx'),
+            # Status filters and ordering used by the election list
+            models.Index(fields=['closed_at', 'start_date', 'end_date'], name='election_status_idx'),
+            # Elections created by a user (profile page, permission checks)
+            models.Index(fields=['created_by', 'closed_at'], name='election_creator_idx'),
+        ]
\ No newline at end of file
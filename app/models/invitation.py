@@ -112,7 +112,7 @@ class Invitation(models.Model):
         if user and not self.invited_user:
             self.invited_user = user
         
-        self.save()
+        self.save(update_fields=['status', 'responded_at', 'invited_user'])
         return True
     
     def decline(self):
@@ -122,18 +122,13 @@ class Invitation(models.Model):
         
         self.status = 'declined'
         self.responded_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'responded_at'])
         return True
     
-    def mark_as_sent(self):
-        """Mark invitation as sent via email"""
-        self.sent_at = timezone.now()
-        self.save()
-    
     def get_invitation_url(self):
         """Get the URL for accepting this invitation"""
         from django.urls import reverse
-        return reverse('invitation_accept', kwargs={'token': self.invitation_token})
+        return reverse('invitation_accept', kwargs={'uuid': self.invitation_token})
     
     class Meta:
         ordering = ['-created_at']
@@ -5,38 +5,45 @@ from django.contrib.auth.models import User
 
 
 # Extend User model with role-checking methods
+def get_group_names(self):
+    """Get the names of the user's groups, loaded once and cached on the instance"""
+    if not hasattr(self, '_group_names'):
+        self._group_names = set(self.groups.values_list('name', flat=True))
+    return self._group_names
+
+
 def is_election_creator(self):
     """Check if user can create elections (superuser or Officials group member)"""
-    return self.is_superuser or self.groups.filter(name='Officials').exists()
+    return self.is_superuser or 'Officials' in self.get_group_names()
 
 
 def is_election_manager(self):
     """Check if user can manage elections (superuser or Officials/Managers group member)"""
     return (self.is_superuser or 
-            self.groups.filter(name__in=['Officials', 'Managers']).exists())
+            not self.get_group_names().isdisjoint({'Officials', 'Managers'}))
 
 
 def is_vote_counter(self):
     """Check if user can count votes and view results"""
     return (self.is_superuser or 
-            self.groups.filter(name__in=['Officials', 'Counters']).exists())
+            not self.get_group_names().isdisjoint({'Officials', 'Counters'}))
 
 
 def can_close_elections(self):
     """Check if user can close elections (superuser or Officials only for security)"""
-    return self.is_superuser or self.groups.filter(name='Officials').exists()
+    return self.is_superuser or 'Officials' in self.get_group_names()
 
 
 def can_manage_candidates(self):
     """Check if user can add/remove candidates"""
     return (self.is_superuser or 
-            self.groups.filter(name__in=['Officials', 'Managers']).exists())
+            not self.get_group_names().isdisjoint({'Officials', 'Managers'}))
 
 
 def can_view_results(self):
     """Check if user can view election results"""
     return (self.is_superuser or 
-            self.groups.filter(name__in=['Officials', 'Counters', 'Viewers']).exists())
+            not self.get_group_names().isdisjoint({'Officials', 'Counters', 'Viewers'}))
 
 
 def get_role_display(self):
@@ -44,7 +51,7 @@ def get_role_display(self):
     if self.is_superuser:
         return "System Administrator"
     
-    user_groups = list(self.groups.values_list('name', flat=True))
+    user_groups = self.get_group_names()
     
     if 'Officials' in user_groups:
         return "Election Official"
@@ -71,9 +78,10 @@ def get_all_roles(self):
         'Viewers': 'Results Viewer'
     }
     
-    for group in self.groups.all():
-        if group.name in group_role_mapping:
-            roles.append(group_role_mapping[group.name])
+    user_groups = self.get_group_names()
+    for group_name, role in group_role_mapping.items():
+        if group_name in user_groups:
+            roles.append(role)
     
     if not roles:
         roles.append("Voter")
@@ -84,10 +92,11 @@ def get_all_roles(self):
 def has_election_permissions(self):
     """Check if user has any election management permissions"""
     return (self.is_superuser or 
-            self.groups.filter(name__in=['Officials', 'Managers', 'Counters']).exists())
+            not self.get_group_names().isdisjoint({'Officials', 'Managers', 'Counters'}))
 
 
 # Add methods to User model
+User.add_to_class('get_group_names', get_group_names)
 User.add_to_class('is_election_creator', is_election_creator)
 User.add_to_class('is_election_manager', is_election_manager)
 User.add_to_class('is_vote_counter', is_vote_counter)
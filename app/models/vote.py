@@ -1,7 +1,6 @@
 """
 Vote model for managing votes in elections
 """
-import json
 import uuid
 from hashlib import sha256
 from django.db import models
@@ -40,15 +39,13 @@ class Vote(models.Model):
     
     def _encrypt_ballot(self):
         """Encrypt the ballot using homomorphic encryption"""
-        candidates = self.election.candidates.order_by('id')
-        candidate_ids = [candidate.id for candidate in candidates]
+        candidate_ids = list(self.election.candidates.order_by('id').values_list('id', flat=True))
         
         # Create binary ballot (1 for selected candidate, 0 for others)
         unencrypted_ballot = [1 if x == self._candidate.id else 0 for x in candidate_ids]
         
         # Parse and use public key for encryption
-        cleaned_key = self.election.public_key.replace("'", '"')
-        public_key = json.loads(cleaned_key)
+        public_key = self.election.parsed_public_key
         encryption = Encryption(public_key=f"{public_key['g']},{public_key['n']}")
         
         # Encrypt each vote in the ballot
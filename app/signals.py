@@ -1,8 +1,10 @@
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User, Group
 from allauth.account.signals import user_signed_up
 from .email_utils import send_welcome_email
+from .tasks import send_welcome_email_task
 
 
 @receiver(post_save, sender=User)
@@ -18,9 +20,10 @@ def assign_user_to_citizens_group(sender, instance, created, **kwargs):
         # Add the user to the Citizens group
         instance.groups.add(citizens_group)
         
-        # Send welcome email if user has an email address
+        # Queue welcome email once the user row is committed and visible to the worker
         if instance.email:
-            send_welcome_email(instance)
+            user_id = instance.pk
+            transaction.on_commit(lambda: send_welcome_email_task.delay(user_id), robust=True)
         
         print(f"User {instance.username} has been added to the Citizens group.")
 
@@ -1,7 +1,8 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from app.models import Election
+from app.models import Election, Candidate
 from app.encryption import Encryption
+from app.cache_utils import bump_index_cache_version
 
 @receiver(post_save, sender=Election)
 def generate_election_keys(sender, instance, created, **kwargs):
@@ -14,4 +15,11 @@ def generate_election_keys(sender, instance, created, **kwargs):
         Election.objects.filter(uuid=instance.uuid).update(
             public_key=public_key,
             private_key=private_key
-        )
\ No newline at end of file
+        )
+
+
+@receiver([post_save, post_delete], sender=Election)
+@receiver([post_save, post_delete], sender=Candidate)
+def invalidate_index_cache(sender, **kwargs):
+    # Homepage cards show election status and candidates
+    bump_index_cache_version()
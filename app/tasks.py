@@ -0,0 +1,71 @@
+"""
+Background tasks executed by Celery workers
+"""
+from celery import group, shared_task
+from django.contrib.auth.models import User
+from django.core.mail import get_connection
+from django.utils import timezone
+
+from app.email_utils import (
+    get_invitation_base_url, send_invitation_email, send_vote_confirmation, send_welcome_email,
+)
+from app.models import Election, Invitation
+
+
+@shared_task
+def send_welcome_email_task(user_id):
+    """Send the welcome email for a newly created user outside the request cycle"""
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or not user.email:
+        return False
+    return send_welcome_email(user)
+
+
+@shared_task
+def send_vote_confirmation_task(user_id, election_id):
+    """Send the vote confirmation email once the vote has been recorded"""
+    user = User.objects.filter(pk=user_id).first()
+    election = Election.objects.filter(pk=election_id).only('id', 'name').first()
+    if user is None or election is None or not user.email:
+        return False
+    return send_vote_confirmation(user, election)
+
+
+# Number of invitation emails sent per task, all over one mail connection
+INVITATION_EMAIL_BATCH_SIZE = 100
+
+
+def _send_pending_invitations(invitation_ids, connection=None):
+    """Email each still-pending invitation and record when it went out"""
+    invitations = Invitation.objects.select_related('election', 'invited_by').filter(
+        pk__in=invitation_ids, status='pending'
+    )
+    base_url = get_invitation_base_url()
+    sent_ids = [
+        invitation.pk for invitation in invitations
+        if send_invitation_email(invitation, connection=connection, base_url=base_url)
+    ]
+    # Record delivery for the whole batch in a single UPDATE
+    Invitation.objects.filter(pk__in=sent_ids).update(sent_at=timezone.now())
+    return len(sent_ids)
+
+
+@shared_task
+def send_invitation_email_task(invitation_id):
+    """Send a single invitation email"""
+    return _send_pending_invitations([invitation_id]) == 1
+
+
+@shared_task
+def send_invitation_emails_task(invitation_ids):
+    """Send a batch of invitation emails over one mail connection"""
+    with get_connection() as connection:
+        return _send_pending_invitations(invitation_ids, connection=connection)
+
+
+def enqueue_invitation_emails(invitation_ids):
+    """Publish batched invitation email tasks to the broker in one group"""
+    group(
+        send_invitation_emails_task.s(invitation_ids[i:i + INVITATION_EMAIL_BATCH_SIZE])
+        for i in range(0, len(invitation_ids), INVITATION_EMAIL_BATCH_SIZE)
+    ).apply_async()
@@ -0,0 +1,46 @@
+"""
+Django settings for running the test suite.
+
+Usage: python manage.py test --settings=app.test_settings --keepdb --parallel=auto
+"""
+
+from project.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+# Sessions and CSRF need a key even when no .env file is present
+SECRET_KEY = 'test-secret-key'
+
+# Run Celery tasks inline; tests still need captureOnCommitCallbacks to fire them
+CELERY_TASK_ALWAYS_EAGER = True
+
+# In-memory SQLite avoids disk I/O during schema setup and test runs
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {
+            'NAME': ':memory:',
+        },
+    }
+}
+
+# Build tables directly from models instead of replaying migrations
+MIGRATION_MODULES = {
+    'app': None,
+}
+
+# Fast hasher for users created in tests; PBKDF2 is needlessly slow here
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Keep uploaded files in memory so tests never touch MEDIA_ROOT
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.InMemoryStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
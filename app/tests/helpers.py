@@ -0,0 +1,51 @@
+"""
+Shared builders for the test suite
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import Group, User
+from django.utils import timezone
+
+from app.models import Candidate, Election
+
+
+def create_user(username, groups=(), **kwargs):
+    """Create a user with an email address, optionally adding them to groups"""
+    user = User.objects.create_user(username, email=f'{username}@example.com', password='password', **kwargs)
+    for name in groups:
+        user.groups.add(Group.objects.get_or_create(name=name)[0])
+    return user
+
+
+def create_election(created_by, status='ongoing', is_public=True, **kwargs):
+    """
+    Create an election in one of the status groups shown on the homepage.
+
+    Args:
+        created_by: User who owns the election
+        status: 'ongoing', 'upcoming' or 'closed'
+        is_public: Whether any user may vote without an invitation
+
+    Returns:
+        Election: The saved election with its generated keys loaded
+    """
+    name = kwargs.pop('name', f'{status.title()} election')
+    now = timezone.now()
+    day = timedelta(days=1)
+    fields = {
+        'ongoing': {'start_date': now - day, 'end_date': now + day, 'active': True, 'started_at': now - day},
+        'upcoming': {'start_date': now + day, 'end_date': now + 2 * day, 'active': False},
+        'closed': {'start_date': now - 2 * day, 'end_date': now - day, 'active': False, 'closed_at': now - day},
+    }[status]
+    fields.update(kwargs)
+    election = Election.objects.create(
+        name=name, description='Test election', created_by=created_by, is_public=is_public, **fields
+    )
+    # Keys are written by a post_save signal with a queryset update
+    election.refresh_from_db()
+    return election
+
+
+def create_candidate(election, username):
+    """Create a candidate backed by a new user"""
+    return Candidate.objects.create(user=create_user(username), election=election)
@@ -0,0 +1,54 @@
+"""
+Tests for the permission checks on CandidateDeleteView
+"""
+from django.conf import settings
+from django.test import TestCase
+from django.urls import reverse
+
+from app.models import Candidate
+from app.tests.helpers import create_candidate, create_election, create_user
+
+
+class CandidateDeleteViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_user('owner')
+        cls.voter = create_user('voter')
+        cls.election = create_election(cls.owner, 'upcoming')
+        cls.candidate = create_candidate(cls.election, 'candidate')
+        cls.url = reverse('delete_candidate', kwargs={'uuid': cls.candidate.uuid})
+
+    def test_anonymous_user_is_sent_to_login(self):
+        for method in (self.client.get, self.client.post):
+            response = method(self.url)
+            self.assertRedirects(
+                response, f'{settings.LOGIN_URL}?next={self.url}', fetch_redirect_response=False
+            )
+        self.assertTrue(Candidate.objects.filter(pk=self.candidate.pk).exists())
+
+    def test_other_user_cannot_remove_candidate(self):
+        self.client.force_login(self.voter)
+        response = self.client.post(self.url)
+
+        self.assertRedirects(response, reverse('election_detail', kwargs={'uuid': self.election.uuid}))
+        self.assertTrue(Candidate.objects.filter(pk=self.candidate.pk).exists())
+
+    def test_election_owner_can_remove_candidate(self):
+        self.client.force_login(self.owner)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        response = self.client.post(self.url)
+
+        self.assertRedirects(response, reverse('election_detail', kwargs={'uuid': self.election.uuid}))
+        self.assertFalse(Candidate.objects.filter(pk=self.candidate.pk).exists())
+
+    def test_candidates_cannot_be_removed_during_voting(self):
+        election = create_election(self.owner, 'ongoing')
+        candidate = create_candidate(election, 'running')
+        self.client.force_login(self.owner)
+
+        response = self.client.post(reverse('delete_candidate', kwargs={'uuid': candidate.uuid}))
+
+        self.assertRedirects(response, reverse('candidate_detail', kwargs={'uuid': candidate.uuid}))
+        self.assertTrue(Candidate.objects.filter(pk=candidate.pk).exists())
@@ -0,0 +1,140 @@
+"""
+Tests for creating, emailing and accepting election invitations
+"""
+from unittest import mock
+
+from django.contrib.sites.models import Site
+from django.core import mail
+from django.test import TestCase
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+
+from app.models import Invitation
+from app.tests.helpers import create_election, create_user
+
+
+class InvitationViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = create_user('owner', groups=['Officials'])
+        cls.existing = create_user('existing')
+        cls.election = create_election(cls.owner, 'upcoming', is_public=False)
+
+    def setUp(self):
+        # The current Site is cached per process, which would skew query counts
+        Site.objects.clear_cache()
+        self.client.force_login(self.owner)
+
+    def send(self, emails):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                reverse('send_invitations', kwargs={'uuid': self.election.uuid}),
+                {'invited_emails': '\n'.join(emails), 'message': 'Please vote', 'expires_in_days': 7},
+            )
+
+    def test_send_creates_invitations_and_emails_them(self):
+        emails = ['new1@example.com', 'new2@example.com', self.existing.email]
+        # Session, user, election, existing invitations, matching users, insert, site, send and mark sent
+        with self.assertNumQueries(9):
+            response = self.send(emails)
+
+        self.assertRedirects(response, reverse('manage_invitations', kwargs={'uuid': self.election.uuid}))
+        invitations = Invitation.objects.filter(election=self.election)
+        self.assertEqual(sorted(i.invited_email for i in invitations), sorted(emails))
+        self.assertEqual(invitations.get(invited_email=self.existing.email).invited_user, self.existing)
+        self.assertFalse(invitations.filter(sent_at__isnull=True).exists())
+
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(emails))
+        invitation = invitations.get(invited_email='new1@example.com')
+        message = next(m for m in mail.outbox if m.to == ['new1@example.com'])
+        self.assertIn(invitation.get_invitation_url(), message.body)
+        self.assertEqual(message.alternatives[0][1], 'text/html')
+
+    def test_send_query_count_does_not_grow_with_addresses(self):
+        with self.assertNumQueries(9):
+            self.send(['new1@example.com'])
+
+    def test_broker_outage_still_reports_created_invitations(self):
+        enqueue = mock.patch(
+            'app.views.invitation.enqueue_invitation_emails', side_effect=OperationalError('broker down')
+        )
+        with enqueue, self.assertLogs('django.test', 'ERROR'):
+            response = self.send(['new1@example.com'])
+
+        self.assertRedirects(response, reverse('manage_invitations', kwargs={'uuid': self.election.uuid}))
+        self.assertTrue(Invitation.objects.filter(invited_email='new1@example.com').exists())
+
+    def test_send_rejects_already_invited_emails(self):
+        self.send(['new1@example.com'])
+        response = self.send(['new1@example.com', 'new2@example.com'])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Invitation.objects.filter(invited_email='new2@example.com').exists())
+
+    def test_only_election_managers_can_send(self):
+        self.client.force_login(self.existing)
+        response = self.send(['new1@example.com'])
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Invitation.objects.exists())
+
+    def test_manage_counts_invitations_by_status(self):
+        for i, status in enumerate(['pending', 'pending', 'accepted', 'declined', 'expired']):
+            Invitation.objects.create(
+                election=self.election, invited_email=f'i{i}@example.com', invited_by=self.owner,
+                status=status, expires_at=self.election.end_date,
+            )
+        response = self.client.get(reverse('manage_invitations', kwargs={'uuid': self.election.uuid}))
+
+        self.assertEqual(
+            response.context['invitation_counts'],
+            {'total': 5, 'pending': 2, 'accepted': 1, 'declined_expired': 2},
+        )
+
+    def test_resend_emails_a_pending_invitation(self):
+        invitation = Invitation.objects.create(
+            election=self.election, invited_email='new1@example.com', invited_by=self.owner,
+            expires_at=self.election.end_date,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('resend_invitation', kwargs={'uuid': invitation.uuid}))
+
+        self.assertEqual([m.to for m in mail.outbox], [['new1@example.com']])
+        invitation.refresh_from_db()
+        self.assertIsNotNone(invitation.sent_at)
+
+    def test_resend_survives_broker_outage(self):
+        invitation = Invitation.objects.create(
+            election=self.election, invited_email='new1@example.com', invited_by=self.owner,
+            expires_at=self.election.end_date,
+        )
+        delay = mock.patch(
+            'app.views.invitation.send_invitation_email_task.delay', side_effect=OperationalError('broker down')
+        )
+        with delay, self.assertLogs('django.test', 'ERROR'), self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(reverse('resend_invitation', kwargs={'uuid': invitation.uuid}))
+
+        self.assertRedirects(response, reverse('manage_invitations', kwargs={'uuid': self.election.uuid}))
+
+    def test_login_completes_pending_invitation(self):
+        invitation = Invitation.objects.create(
+            election=self.election, invited_email=self.existing.email, invited_by=self.owner,
+            expires_at=self.election.end_date,
+        )
+        self.client.force_login(self.existing)
+        session = self.client.session
+        session['invitation_token'] = str(invitation.invitation_token)
+        session.save()
+
+        response = self.client.get(reverse('process_pending_invitation'))
+
+        self.assertRedirects(response, reverse('election_detail', kwargs={'uuid': self.election.uuid}))
+        self.assertNotIn('invitation_token', self.client.session)
+        invitation.refresh_from_db()
+        self.assertEqual(invitation.status, 'accepted')
+        self.assertEqual(invitation.invited_user, self.existing)
+
+    def test_pending_invitation_without_token_goes_home(self):
+        response = self.client.get(reverse('process_pending_invitation'))
+        self.assertRedirects(response, reverse('index'))
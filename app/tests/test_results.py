@@ -0,0 +1,24 @@
+"""
+Tests for the results verification page
+"""
+from django.test import TestCase
+from django.urls import reverse
+
+from app.tests.helpers import create_election, create_user
+
+
+class VerifyResultsViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.official = create_user('official', groups=['Officials'])
+
+    def test_election_without_published_tally_is_reported_unverified(self):
+        for status in ('ongoing', 'closed'):
+            election = create_election(self.official, status)
+            self.assertTrue(election.public_key)
+
+            response = self.client.get(reverse('verify_results', kwargs={'uuid': election.uuid}))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNone(response.context['verified'])
@@ -0,0 +1,139 @@
+"""
+Query-count regression tests for the homepage and profile views
+"""
+import re
+from collections import Counter
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.middleware.csrf import _unmask_cipher_token
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from app.models import Invitation, Vote
+from app.tests.helpers import create_candidate, create_election, create_user
+
+
+def duplicate_queries(queries):
+    """Return SQL statements that ran more than once"""
+    counts = Counter(query['sql'] for query in queries)
+    return [sql for sql, count in counts.items() if count > 1]
+
+
+class IndexQueryTests(TestCase):
+    """The homepage builds its election data in a fixed number of queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.official = create_user('official', groups=['Officials'])
+        for status in ('ongoing', 'upcoming', 'closed'):
+            for i in range(4):
+                election = create_election(cls.official, status, name=f'{status} {i}')
+                for j in range(3):
+                    create_candidate(election, f'{status}-{i}-{j}')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_index_query_count(self):
+        # Three bucket queries, three candidate prefetches and one aggregate
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['elections_count']['total'], 12)
+
+    def test_index_has_no_duplicate_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('index'))
+        self.assertEqual(duplicate_queries(queries), [])
+
+    def test_cached_index_runs_no_queries(self):
+        self.client.get(reverse('index'))
+        with self.assertNumQueries(0):
+            response = Client().get(reverse('index'))
+        self.assertEqual(len(response.context['ongoing_elections']), 4)
+
+    def test_cached_index_does_not_share_csrf_token(self):
+        first, second = Client(), Client()
+        first.get(reverse('index'))
+        response = second.get(reverse('index'))
+
+        # The second visitor gets their own cookie, and the page carries their token
+        self.assertIn('csrftoken', response.cookies)
+        token = re.search(r'X-CSRFToken": "([^"]+)"', response.content.decode()).group(1)
+        self.assertEqual(_unmask_cipher_token(token), response.cookies['csrftoken'].value)
+        self.assertNotEqual(response.cookies['csrftoken'].value, first.cookies['csrftoken'].value)
+
+    def test_new_election_invalidates_cached_index(self):
+        self.client.get(reverse('index'))
+        # Ends soonest, so it takes one of the four ongoing slots
+        create_election(
+            self.official, 'ongoing', name='Fresh election', end_date=timezone.now() + timedelta(hours=1)
+        )
+        response = self.client.get(reverse('index'))
+        self.assertContains(response, 'Fresh election')
+
+
+class ElectionListQueryTests(TestCase):
+    """The election list builds its cards without joining data they do not show"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.official = create_user('official', groups=['Officials'])
+        for status in ('ongoing', 'upcoming', 'closed'):
+            election = create_election(cls.official, status)
+            create_candidate(election, f'{status}-candidate')
+
+    def test_list_does_not_join_the_creator(self):
+        self.client.force_login(self.official)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('election_list'))
+        self.assertEqual(len(response.context['elections']), 3)
+
+        election_queries = [q['sql'] for q in queries if 'FROM "app_election"' in q['sql']]
+        self.assertTrue(election_queries)
+        for sql in election_queries:
+            self.assertNotIn('JOIN "auth_user"', sql)
+        self.assertEqual(duplicate_queries(queries), [])
+
+
+class ProfileQueryTests(TestCase):
+    """The profile page does not issue queries per vote, election or invitation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user('voter', groups=['Officials'])
+        cls.add_rows(cls.user, 2)
+
+    @staticmethod
+    def add_rows(user, count):
+        """Give the user more created elections, votes and invitations"""
+        for _ in range(count):
+            election = create_election(user, 'ongoing', is_public=False)
+            Vote.objects.create(user=user, election=election)
+            Invitation.objects.create(
+                election=election, invited_email=user.email, invited_by=user,
+                expires_at=election.end_date,
+            )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def get_profile_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('profile'))
+        self.assertEqual(response.status_code, 200)
+        return queries
+
+    def test_profile_query_count(self):
+        # Session, user, created elections and their candidates, invitations, votes and groups
+        with self.assertNumQueries(7):
+            self.client.get(reverse('profile'))
+
+    def test_profile_query_count_does_not_grow_with_rows(self):
+        before = len(self.get_profile_queries())
+        self.add_rows(self.user, 3)
+        self.assertEqual(len(self.get_profile_queries()), before)
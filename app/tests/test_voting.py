@@ -0,0 +1,93 @@
+"""
+Tests for casting votes through VoteView
+"""
+from unittest import mock
+
+from django.contrib.messages import get_messages
+from django.core import mail
+from django.test import TestCase
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+
+from app.models import Invitation, Vote
+from app.tests.helpers import create_candidate, create_election, create_user
+
+
+class VoteViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.official = create_user('official', groups=['Officials'])
+        cls.voter = create_user('voter')
+        cls.election = create_election(cls.official, 'ongoing')
+        cls.candidates = [create_candidate(cls.election, f'candidate{i}') for i in range(3)]
+
+    def setUp(self):
+        self.client.force_login(self.voter)
+
+    def vote(self, candidate):
+        """Post a vote and return the response with the message it added"""
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('vote', kwargs={'uuid': candidate.uuid}))
+        # Redirects are not followed, so earlier messages are still queued
+        return response, str(list(get_messages(response.wsgi_request))[-1])
+
+    def test_vote_is_recorded_and_confirmed(self):
+        response, message = self.vote(self.candidates[1])
+
+        self.assertRedirects(response, reverse('election_detail', kwargs={'uuid': self.election.uuid}))
+        self.assertEqual(message, 'Your vote has been recorded successfully!')
+        vote = Vote.objects.get(user=self.voter, election=self.election)
+        self.assertTrue(vote.hashed)
+        self.assertEqual([m.to for m in mail.outbox], [[self.voter.email]])
+
+    def test_second_vote_is_rejected_by_the_unique_constraint(self):
+        self.vote(self.candidates[0])
+        response, message = self.vote(self.candidates[1])
+
+        self.assertRedirects(response, reverse('election_detail', kwargs={'uuid': self.election.uuid}))
+        self.assertEqual(message, 'You have already voted in this election.')
+        self.assertEqual(Vote.objects.filter(user=self.voter, election=self.election).count(), 1)
+
+    def test_broker_outage_does_not_report_a_recorded_vote_as_failed(self):
+        delay = mock.patch(
+            'app.views.vote.send_vote_confirmation_task.delay', side_effect=OperationalError('broker down')
+        )
+        with delay, self.assertLogs('django.test', 'ERROR'):
+            response, message = self.vote(self.candidates[0])
+
+        self.assertRedirects(response, reverse('election_detail', kwargs={'uuid': self.election.uuid}))
+        self.assertEqual(message, 'Your vote has been recorded successfully!')
+        self.assertTrue(Vote.objects.filter(user=self.voter, election=self.election).exists())
+
+    def test_private_election_requires_accepted_invitation(self):
+        election = create_election(self.official, 'ongoing', is_public=False)
+        candidate = create_candidate(election, 'private-candidate')
+
+        _, message = self.vote(candidate)
+        self.assertEqual(message, 'This is a private election. You need an invitation to vote.')
+        self.assertFalse(Vote.objects.filter(election=election).exists())
+
+        Invitation.objects.create(
+            election=election, invited_email=self.voter.email, invited_by=self.official,
+            status='accepted', expires_at=election.end_date,
+        )
+        _, message = self.vote(candidate)
+        self.assertEqual(message, 'Your vote has been recorded successfully!')
+
+    def test_closed_election_rejects_votes(self):
+        election = create_election(self.official, 'closed')
+        candidate = create_candidate(election, 'closed-candidate')
+
+        _, message = self.vote(candidate)
+        self.assertEqual(message, 'Voting is not currently open for this election.')
+        self.assertFalse(Vote.objects.filter(election=election).exists())
+
+    def test_recorded_vote_is_counted_in_results(self):
+        self.vote(self.candidates[2])
+        self.election.close_election()
+        self.election.save()
+
+        results = self.election.get_results()
+        self.assertEqual(results['total_votes'], 1)
+        self.assertEqual(results['results'][0]['candidate'], self.candidates[2])
@@ -10,16 +10,15 @@ class CustomLoginView(LoginView):
     and regular users to the homepage
     """
     template_name = 'registration/login.html'
+    # Already-authenticated users are redirected instead of re-rendering the form
+    redirect_authenticated_user = True
+    
+    ADMIN_URL = '/admin/'
+    HOME_URL = '/'
     
     def get_success_url(self):
         """
         Redirect admin users to /admin, others to homepage
         """
         user = self.request.user
-        
-        # Check if user is staff/admin
-        if user.is_staff or user.is_superuser:
-            return '/admin/'
-        
-        # Regular users go to homepage
-        return '/'
\ No newline at end of file
+        return self.ADMIN_URL if (user.is_staff or user.is_superuser) else self.HOME_URL
@@ -3,48 +3,77 @@ Base views for general functionality like homepage and profile
 """
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from app.models import Election, Vote, Invitation
+from django.core.cache import cache
+from django.db.models import Count, Prefetch, Q
+from app.models import Election, Candidate, Vote, Invitation
+from app.cache_utils import get_index_cache_version
 
-def index(request):
-    """Homepage view showing election summary and ongoing elections"""
-    # Get elections organized by status
-    all_elections = Election.objects.all().select_related('created_by')
-    
-    ongoing_elections = []
-    upcoming_elections = []
-    recently_closed_elections = []
+# Columns read by the election card partial (status helpers included)
+ELECTION_CARD_FIELDS = (
+    'id', 'uuid', 'name', 'start_date', 'end_date', 'created', 'created_by',
+    'is_public', 'active', 'started_at', 'closed_at',
+)
+
+
+# How long the homepage election data is reused before being rebuilt
+INDEX_CACHE_TIMEOUT = 60 * 5
+
+
+def _index_context():
+    """Build the homepage election buckets and counts"""
+    from django.utils import timezone
+    now = timezone.now()
     
-    for election in all_elections:
-        status = election.get_status()
-        if status == 'open':
-            ongoing_elections.append(election)
-        elif status in ['scheduled', 'inactive']:
-            upcoming_elections.append(election)
-        elif status in ['closed', 'expired']:
-            recently_closed_elections.append(election)
+    # Status is computed in SQL so each bucket is a bounded query. Candidates
+    # are prefetched so the cached cards render without further queries.
+    elections = Election.objects.with_status(now).only(
+        *ELECTION_CARD_FIELDS
+    ).prefetch_related(
+        Prefetch('candidates', queryset=Candidate.objects.select_related('user__profile', 'party'))
+    )
     
-    # Sort ongoing elections by end date (soonest ending first)
-    ongoing_elections.sort(key=lambda x: x.end_date)
+    # Soonest ending first
+    ongoing_elections = list(
+        elections.filter(status_code=Election.STATUS_ONGOING).order_by('end_date')[:4]
+    )
+    # Soonest starting first; one extra row to fill the featured slots
+    upcoming_elections = list(
+        elections.filter(status_code=Election.STATUS_UPCOMING).order_by('start_date')[:4]
+    )
+    # Most recently ended first
+    recently_closed_elections = list(
+        elections.filter(status_code=Election.STATUS_CLOSED).order_by('-end_date')[:3]
+    )
     
     # Get featured elections (up to 4 most recent ongoing or upcoming)
     featured_elections = ongoing_elections[:4]
     if len(featured_elections) < 4:
         remaining_slots = 4 - len(featured_elections)
-        upcoming_elections.sort(key=lambda x: x.start_date)
         featured_elections.extend(upcoming_elections[:remaining_slots])
     
-    context = {
+    # Count every bucket in a single query
+    elections_count = Election.objects.with_status(now).aggregate(
+        ongoing=Count('pk', filter=Q(status_code=Election.STATUS_ONGOING)),
+        upcoming=Count('pk', filter=Q(status_code=Election.STATUS_UPCOMING)),
+        recently_closed=Count('pk', filter=Q(status_code=Election.STATUS_CLOSED)),
+        total=Count('pk'),
+    )
+    
+    return {
         'elections': featured_elections,  # For backward compatibility
         'ongoing_elections': ongoing_elections,
         'upcoming_elections': upcoming_elections[:3],  # Show only next 3 upcoming
-        'recently_closed_elections': recently_closed_elections[:3],  # Show only last 3 closed
-        'elections_count': {
-            'ongoing': len(ongoing_elections),
-            'upcoming': len(upcoming_elections),
-            'recently_closed': len(recently_closed_elections),
-            'total': len(all_elections)
-        }
+        'recently_closed_elections': recently_closed_elections,  # Show only last 3 closed
+        'elections_count': elections_count,
     }
+
+
+def index(request):
+    """Homepage view showing election summary and ongoing elections"""
+    # Only the election data is cached; the page itself is rendered per request
+    # so CSRF tokens and user-specific markup are never shared between visitors
+    cache_key = f'index-context-v{get_index_cache_version()}'
+    context = cache.get_or_set(cache_key, _index_context, INDEX_CACHE_TIMEOUT)
     
     return render(request, 'app/index.html', context)
 
@@ -54,22 +83,31 @@ def profile(request):
     votes = Vote.objects.filter(user=request.user).select_related('election')
     
     # Get elections created by this user (if they're an official)
-    created_elections = Election.objects.filter(created_by=request.user).order_by('-created')
+    # Only load the columns the election cards render; skips the key material
+    created_elections = Election.objects.filter(created_by=request.user).only(
+        *ELECTION_CARD_FIELDS
+    ).prefetch_related(
+        Prefetch('candidates', queryset=Candidate.objects.select_related('user__profile', 'party'))
+    ).order_by('-created')
     
     # Add can_edit attribute to each election using the model method
     for election in created_elections:
         # Use the model's is_editable method
         election.can_edit = election.is_editable()
     
-    # Get invitations for this user
-    invitations = Invitation.objects.filter(
+    # Get invitations for this user in one query
+    # Only the columns the invitation list renders are loaded
+    invitations = list(Invitation.objects.filter(
         invited_email=request.user.email
-    ).select_related('election').order_by('-created_at')
+    ).select_related('election').only(
+        'id', 'status', 'created_at', 'expires_at', 'invitation_token', 'election',
+        'election__uuid', 'election__name', 'election__start_date', 'election__end_date'
+    ).order_by('-created_at'))
     
-    # Categorize invitations by status
-    pending_invitations = invitations.filter(status='pending')
-    accepted_invitations = invitations.filter(status='accepted')
-    declined_invitations = invitations.filter(status='declined')
+    # Categorize invitations by status in Python instead of re-querying
+    pending_invitations = [i for i in invitations if i.status == 'pending']
+    accepted_invitations = [i for i in invitations if i.status == 'accepted']
+    declined_invitations = [i for i in invitations if i.status == 'declined']
     
     return render(request, 'app/profile.html', {
         'votes': votes,
@@ -79,10 +117,10 @@ def profile(request):
         'accepted_invitations': accepted_invitations,
         'declined_invitations': declined_invitations,
         'invitation_counts': {
-            'total': invitations.count(),
-            'pending': pending_invitations.count(),
-            'accepted': accepted_invitations.count(),
-            'declined': declined_invitations.count(),
+            'total': len(invitations),
+            'pending': len(pending_invitations),
+            'accepted': len(accepted_invitations),
+            'declined': len(declined_invitations),
         }
     })
 
@@ -41,9 +41,10 @@ class CandidateCreateView(LoginRequiredMixin, CreateView):
         form.instance.election = self.election
         response = super().form_valid(form)
         
-        # Create user profile if it doesn't exist (since they're now a candidate)
+        # Create user profile if it doesn't exist (since they're now a candidate).
+        # A single INSERT ... ON CONFLICT DO NOTHING is race-free under concurrent adds.
         from app.models import Profile
-        Profile.objects.get_or_create(user=self.object.user)
+        Profile.objects.bulk_create([Profile(user=self.object.user)], ignore_conflicts=True)
         
         messages.success(
             self.request, 
@@ -59,19 +60,21 @@ class CandidateCreateView(LoginRequiredMixin, CreateView):
         context['election'] = self.election
         
         # Check if there are any available candidates
-        from django.contrib.auth.models import User
+        from django.contrib.auth.models import User, Group
+        from django.db.models import Exists, OuterRef
         from app.models import Candidate
         
         existing_candidate_users = Candidate.objects.filter(
             election=self.election
-        ).values_list('user_id', flat=True)
+        ).values('user_id')
         
+        # EXISTS on group membership yields each user once, so no DISTINCT is needed
         available_users = User.objects.filter(
+            Exists(Group.objects.filter(name='Candidates', user=OuterRef('pk'))),
             is_active=True,
-            groups__name='Candidates'
-        ).exclude(id__in=existing_candidate_users).distinct()
+        ).exclude(id__in=existing_candidate_users).only('id')
         
-        context['no_candidates_available'] = available_users.count() == 0
+        context['no_candidates_available'] = not available_users.exists()
         
         return context
     
@@ -83,7 +86,7 @@ class CandidateCreateView(LoginRequiredMixin, CreateView):
     
     def _is_official(self, user):
         """Check if user is an official who can manage candidates"""
-        return user.is_superuser or user.groups.filter(name='Officials').exists()
+        return user.is_authenticated and (user.is_superuser or 'Officials' in user.get_group_names())
 
 
 class CandidateUpdateView(LoginRequiredMixin, UpdateView):
@@ -91,37 +94,27 @@ class CandidateUpdateView(LoginRequiredMixin, UpdateView):
     model = Candidate
     form_class = CandidateForm
     template_name = 'app/candidates/edit.html'
+    slug_field = 'uuid'
+    slug_url_kwarg = 'uuid'
+    
+    def get_queryset(self):
+        """Join the election and user read by the permission checks and templates"""
+        return Candidate.objects.select_related('election', 'user')
     
     def get_object(self, queryset=None):
-        """Get the candidate object and set the election"""
-        obj = super().get_object(queryset)
-        self.election = obj.election
-        return obj
+        """Get the candidate object and set the election, fetching it once per request"""
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+            self.election = self._object.election
+        return self._object
     
     def dispatch(self, request, *args, **kwargs):
-        """Check permissions and get election"""
+        """Check permissions and election status once for both GET and POST"""
         if not self._is_official(request.user):
             messages.error(request, "You don't have permission to edit candidates.")
             return redirect('election_list')
         
-        return super().dispatch(request, *args, **kwargs)
-    
-    def get(self, request, *args, **kwargs):
-        """Handle GET request with permission checks"""
-        candidate = self.get_object()
-        
-        # Check if election can be edited (not active during voting or closed)
-        if not self.election.is_editable():
-            if self.election.closed_at:
-                messages.error(request, "Cannot edit candidates in a closed election.")
-            else:
-                messages.error(request, "Cannot edit candidates during active voting period.")
-            return redirect('candidate_detail', uuid=candidate.uuid)
-        
-        return super().get(request, *args, **kwargs)
-    
-    def post(self, request, *args, **kwargs):
-        """Handle POST request with permission checks"""
+        # Loads the candidate and election; UpdateView reuses the cached object
         candidate = self.get_object()
         
         # Check if election can be edited (not active during voting or closed)
@@ -132,7 +125,7 @@ class CandidateUpdateView(LoginRequiredMixin, UpdateView):
                 messages.error(request, "Cannot edit candidates during active voting period.")
             return redirect('candidate_detail', uuid=candidate.uuid)
         
-        return super().post(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
     
     def form_valid(self, form):
         """Handle successful form submission"""
@@ -154,22 +147,33 @@ class CandidateUpdateView(LoginRequiredMixin, UpdateView):
     
     def _is_official(self, user):
         """Check if user is an official who can manage candidates"""
-        return user.is_superuser or user.groups.filter(name='Officials').exists()
+        return user.is_authenticated and (user.is_superuser or 'Officials' in user.get_group_names())
 
 
 class CandidateDeleteView(LoginRequiredMixin, DeleteView):
     """Remove a candidate from an election"""
     model = Candidate
     template_name = 'app/candidates/delete.html'
+    slug_field = 'uuid'
+    slug_url_kwarg = 'uuid'
+    
+    def get_queryset(self):
+        """Join the election and user read by the permission checks and templates"""
+        return Candidate.objects.select_related('election', 'user')
     
     def get_object(self, queryset=None):
-        """Get the candidate object and set the election"""
-        obj = super().get_object(queryset)
-        self.election = obj.election
-        return obj
+        """Get the candidate object and set the election, fetching it once per request"""
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+            self.election = self._object.election
+        return self._object
     
     def dispatch(self, request, *args, **kwargs):
         """Check permissions and election status"""
+        # The checks below run before LoginRequiredMixin's, so apply it first
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        
         # Check if user can remove candidates from this election
         candidate = self.get_object()
         if not self._can_remove_candidate(request.user, self.election):
@@ -213,13 +217,13 @@ class CandidateDeleteView(LoginRequiredMixin, DeleteView):
         # 1. The election creator/owner
         # 2. Superuser 
         # 3. Election manager (using new user extension)
-        return (user == election.created_by or 
+        return (user.pk == election.created_by_id or 
                 user.is_superuser or 
                 user.is_election_manager())
     
     def _is_official(self, user):
         """Check if user is an official who can manage candidates"""
-        return user.is_superuser or user.groups.filter(name='Officials').exists()
+        return user.is_authenticated and (user.is_superuser or 'Officials' in user.get_group_names())
 
 
 class CandidateDetailView(DetailView):
@@ -230,21 +234,24 @@ class CandidateDetailView(DetailView):
     slug_field = 'uuid'
     slug_url_kwarg = 'uuid'
     
+    def get_queryset(self):
+        """Join the election and user read by the permission checks and templates"""
+        return Candidate.objects.select_related('election', 'user')
+    
     def dispatch(self, request, *args, **kwargs):
         """Verify candidate exists"""
         return super().dispatch(request, *args, **kwargs)
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        candidate = self.get_object()
+        candidate = self.object
         election = candidate.election
         context['election'] = election
         
         if self.request.user.is_authenticated:
             # Check if current user has voted in this election
             from app.models import Vote
-            user_votes = Vote.objects.filter(election=election, user=self.request.user)
-            context['voted'] = user_votes.count()
+            context['voted'] = Vote.objects.filter(election=election, user=self.request.user).exists()
             
             # Check if current user can remove this candidate
             context['can_remove_candidate'] = self._can_remove_candidate(
@@ -252,7 +259,7 @@ class CandidateDetailView(DetailView):
                 election
             )
         else:
-            context['voted'] = 0
+            context['voted'] = False
             context['can_remove_candidate'] = False
         
         return context
@@ -265,6 +272,6 @@ class CandidateDetailView(DetailView):
         # 1. The election creator/owner
         # 2. Superuser 
         # 3. Election manager (using new user extension)
-        return (user == election.created_by or 
+        return (user.pk == election.created_by_id or 
                 user.is_superuser or 
                 user.is_election_manager())
\ No newline at end of file
@@ -6,13 +6,44 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.core.cache import cache
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db.models import BooleanField, Case, Count, Exists, F, OuterRef, Prefetch, Q, Value, When
 from collections import defaultdict
+from datetime import timedelta
 
-from app.models import Election, Vote
+from app.models import Election, Candidate, Vote
 from app.forms import ElectionForm, ElectionUpdateForm
 
 
+def _month_bounds(day):
+    """Return the first and last day of the month containing ``day``"""
+    start = day.replace(day=1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    return start, end
+
+
+def _no_date_range(now):
+    """Unbounded range used for 'all' and unknown date range values"""
+    return None, None
+
+
+# Date range filter values accepted by ElectionListView, mapped to (start, end) builders
+DATE_RANGES = {
+    'this-week': lambda now: (now - timedelta(days=7), now + timedelta(days=7)),
+    'this-month': lambda now: _month_bounds(now),
+    'next-month': lambda now: _month_bounds(now.replace(day=1) + timedelta(days=32)),
+    'last-month': lambda now: _month_bounds(now.replace(day=1) - timedelta(days=1)),
+}
+
+# Status filter values accepted by ElectionListView
+STATUS_FILTERS = {
+    'ongoing': Election.STATUS_ONGOING,
+    'upcoming': Election.STATUS_UPCOMING,
+    'closed': Election.STATUS_CLOSED,
+}
+
+
 class ElectionListView(ListView):
     """List elections organized by status: ongoing, upcoming, and recently closed"""
     model = Election
@@ -23,7 +54,6 @@ class ElectionListView(ListView):
         """Organize elections by status with filtering"""
         context = super().get_context_data(**kwargs)
         from django.utils import timezone
-        from datetime import timedelta
         now = timezone.now()
         
         # Get filter parameters
@@ -37,72 +67,49 @@ class ElectionListView(ListView):
         else:
             selected_statuses = [status_filter]
         
-        # Get all elections and apply search filter
-        all_elections = Election.objects.all().select_related('created_by')
+        # Collect every filter into one Q so the queryset is built once
+        filters = Q(
+            status_code__in=[STATUS_FILTERS[status] for status in selected_statuses if status in STATUS_FILTERS]
+        )
         
         if search_term:
-            all_elections = all_elections.filter(name__icontains=search_term)
+            filters &= Q(name__icontains=search_term)
         
         # Apply date range filter
-        if date_range != 'all':
-            if date_range == 'this-week':
-                start_date = now - timedelta(days=7)
-                end_date = now + timedelta(days=7)
-            elif date_range == 'this-month':
-                start_date = now.replace(day=1)
-                end_date = (start_date + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-            elif date_range == 'next-month':
-                next_month = now.replace(day=1) + timedelta(days=32)
-                start_date = next_month.replace(day=1)
-                end_date = (start_date + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-            elif date_range == 'last-month':
-                end_date = now.replace(day=1) - timedelta(days=1)
-                start_date = end_date.replace(day=1)
-            else:
-                start_date = end_date = None
-            
-            if start_date and end_date:
-                all_elections = all_elections.filter(
-                    start_date__gte=start_date,
-                    end_date__lte=end_date
-                )
-        
-        # Organize by status and apply status filter
-        ongoing_elections = []
-        upcoming_elections = []
-        recently_closed_elections = []
-        
-        for election in all_elections:
-            status = election.get_status()
-            if status == 'open' and 'ongoing' in selected_statuses:
-                ongoing_elections.append(election)
-            elif status in ['scheduled', 'inactive'] and 'upcoming' in selected_statuses:
-                upcoming_elections.append(election)
-            elif status in ['closed', 'expired'] and 'closed' in selected_statuses:
-                recently_closed_elections.append(election)
-        
-        # Sort each category
-        ongoing_elections.sort(key=lambda x: x.end_date)  # Soonest ending first
-        upcoming_elections.sort(key=lambda x: x.start_date)  # Soonest starting first
-        recently_closed_elections.sort(key=lambda x: x.end_date, reverse=True)  # Most recently closed first
-        
-        # Combine all filtered elections into a single list
-        all_filtered_elections = ongoing_elections + upcoming_elections + recently_closed_elections
-        
-        # Sort the combined list: ongoing first (by end date), then upcoming (by start date), then closed (by end date desc)
-        def sort_key(election):
-            status = election.get_status()
-            if status == 'open':
-                return (0, election.end_date)  # Ongoing elections first, sorted by end date
-            elif status in ['scheduled', 'inactive']:
-                return (1, election.start_date)  # Upcoming elections second, sorted by start date
-            else:  # closed/expired
-                return (2, -election.end_date.timestamp())  # Closed elections last, sorted by end date desc
-        
-        all_filtered_elections.sort(key=sort_key)
-        
-        # Add pagination
-        paginator = Paginator(all_filtered_elections, 6)  # Show 6 elections per page (3 rows of 2)
+        start_date, end_date = DATE_RANGES.get(date_range, _no_date_range)(now)
+        if start_date and end_date:
+            filters &= Q(start_date__gte=start_date, end_date__lte=end_date)
+        
+        # Get filtered elections with their status computed in SQL, ordered:
+        # ongoing first (by end date), then upcoming (by start date), then
+        # closed (by end date desc)
+        all_elections = Election.objects.with_status(now).filter(filters).defer(
+            'description', 'private_key', 'public_key'  # Not shown on election cards
+        ).prefetch_related(
+            Prefetch('candidates', queryset=Candidate.objects.select_related('user__profile', 'party'))
+        ).order_by(
+            'status_code',
+            Case(
+                When(status_code=Election.STATUS_ONGOING, then=F('end_date')),
+                When(status_code=Election.STATUS_UPCOMING, then=F('start_date')),
+            ).asc(),
+            F('end_date').desc(),
+        )
+        
+        # Count elections per status and in total in a single query
+        elections_count = all_elections.order_by().aggregate(
+            ongoing=Count('pk', filter=Q(status_code=Election.STATUS_ONGOING)),
+            upcoming=Count('pk', filter=Q(status_code=Election.STATUS_UPCOMING)),
+            recently_closed=Count('pk', filter=Q(status_code=Election.STATUS_CLOSED)),
+            total=Count('pk'),
+        )
+        
+        # Add pagination; only the current page is fetched from the database.
+        # Per-user flags are annotated here so cards never query per row.
+        paginator = Paginator(
+            all_elections.annotate(**self._user_annotations()), 6
+        )  # Show 6 elections per page (3 rows of 2)
+        paginator.count = elections_count['total']  # Reuse the total instead of a second COUNT(*)
         page_number = self.request.GET.get('page')
         page_obj = paginator.get_page(page_number)
         
@@ -117,15 +124,7 @@ class ElectionListView(ListView):
             'elections': page_obj,  # Paginated elections for template
             'page_obj': page_obj,  # Page object for pagination controls
             'query_params': query_params,  # For pagination partial
-            'ongoing_elections': ongoing_elections,
-            'upcoming_elections': upcoming_elections,
-            'recently_closed_elections': recently_closed_elections,
-            'elections_count': {
-                'ongoing': len(ongoing_elections),
-                'upcoming': len(upcoming_elections),
-                'recently_closed': len(recently_closed_elections),
-                'total': len(all_filtered_elections)
-            },
+            'elections_count': elections_count,
             'selected_statuses': selected_statuses,
             'selected_status': status_filter,  # Single status for dropdown
             'search_term': search_term,
@@ -137,6 +136,23 @@ class ElectionListView(ListView):
     def get_queryset(self):
         """Return empty queryset since we handle all elections in get_context_data"""
         return Election.objects.none()
+    
+    def _user_annotations(self):
+        """Annotations for whether the current user voted in or owns each election"""
+        user = self.request.user
+        if not user.is_authenticated:
+            return {
+                'user_voted': Value(False, output_field=BooleanField()),
+                'is_owner': Value(False, output_field=BooleanField()),
+            }
+        return {
+            'user_voted': Exists(Vote.objects.filter(election=OuterRef('pk'), user=user)),
+            'is_owner': Case(
+                When(created_by=user, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+        }
 
 
 class ElectionDetailView(DetailView):
@@ -147,18 +163,21 @@ class ElectionDetailView(DetailView):
     slug_field = 'uuid'
     slug_url_kwarg = 'uuid'
     
+    def get_queryset(self):
+        """Join the creator, which the template compares against the current user"""
+        return Election.objects.select_related('created_by')
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        election = self.get_object()
+        election = self.object
         
         # Check if current user has voted (only for authenticated users)
         if self.request.user.is_authenticated:
-            user_votes = Vote.objects.filter(election=election, user=self.request.user)
-            context['voted'] = user_votes.count()
+            context['voted'] = Vote.objects.filter(election=election, user=self.request.user).exists()
             context['can_edit'] = self._can_edit_election(election, self.request.user)
             context['can_user_vote'] = election.can_user_vote(self.request.user)
         else:
-            context['voted'] = 0
+            context['voted'] = False
             context['can_edit'] = False
             context['can_user_vote'] = False
         
@@ -173,12 +192,21 @@ class ElectionDetailView(DetailView):
             return False
         # User can edit if they are an election manager or the creator
         has_permission = (user.is_election_manager() or 
-                         election.created_by == user)
+                         election.created_by_id == user.pk)
         return has_permission and election.is_editable()
     
     def _count_votes(self, election):
         """Get vote results using the election's built-in method"""
-        return election.get_results()
+        # Open elections never show results, so skip decrypting the ballots
+        if not election.can_show_results():
+            return None
+        
+        if election.closed_at is None:
+            return election.get_results()
+        
+        # No votes can be cast after closing, so the tally is cached for good
+        cache_key = f'election_results:{election.uuid}:{election.closed_at.timestamp()}'
+        return cache.get_or_set(cache_key, election.get_results, timeout=None)
 
 
 class ElectionCreateView(LoginRequiredMixin, CreateView):
@@ -243,7 +271,7 @@ class ElectionUpdateView(LoginRequiredMixin, UpdateView):
         """Check if current user can edit this election"""
         # User can edit if they are an election manager or the creator
         has_permission = (user.is_election_manager() or 
-                         election.created_by == user)
+                         election.created_by_id == user.pk)
         return has_permission and election.is_editable()
     
     def _is_official(self, user):
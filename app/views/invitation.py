@@ -5,14 +5,16 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import HttpResponseForbidden, Http404
-from django.core.mail import send_mail
-from django.conf import settings
-from django.template.loader import render_to_string
 from django.urls import reverse
-from django.contrib.sites.models import Site
+from django.db import transaction
+from django.db.models import Count, Q
 
 from app.models import Election, Invitation
 from app.forms import InvitationForm, InvitationResponseForm
+from app.tasks import enqueue_invitation_emails, send_invitation_email_task
+
+# Fields the resend and cancel views need, including the election's permission check
+MANAGED_INVITATION_FIELDS = ('id', 'status', 'invited_email', 'election__uuid', 'election__created_by')
 
 
 @login_required
@@ -43,16 +45,14 @@ def send_invitations(request, uuid):
             try:
                 invitations = form.save_invitations(request.user)
                 
-                # Send email notifications
-                successful_emails = 0
-                for invitation in invitations:
-                    if send_invitation_email(invitation):
-                        invitation.mark_as_sent()
-                        successful_emails += 1
+                # Queue email notifications once the invitations are committed. The
+                # rows already exist, so a broker outage is logged rather than reported.
+                invitation_ids = [invitation.pk for invitation in invitations]
+                transaction.on_commit(lambda: enqueue_invitation_emails(invitation_ids), robust=True)
                 
                 messages.success(
                     request, 
-                    f"Successfully sent {successful_emails} invitations out of {len(invitations)} total."
+                    f"Created {len(invitations)} invitations. Emails are being sent in the background."
                 )
                 return redirect('manage_invitations', uuid=election.uuid)
                 
@@ -86,23 +86,22 @@ def manage_invitations(request, uuid):
             messages.error(request, "Cannot manage invitations during active voting period.")
         return redirect('election_detail', uuid=election.uuid)
     
-    invitations = election.invitations.all().order_by('-created_at')
+    invitations = election.invitations.select_related('invited_user').order_by('-created_at')
     
-    # Calculate invitation counts
-    total_invitations = invitations.count()
-    pending_invitations = invitations.filter(status='pending').count()
-    accepted_invitations = invitations.filter(status='accepted').count()
-    declined_expired_invitations = total_invitations - pending_invitations - accepted_invitations
+    # Calculate invitation counts in a single query
+    invitation_counts = election.invitations.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        accepted=Count('id', filter=Q(status='accepted')),
+    )
+    invitation_counts['declined_expired'] = (
+        invitation_counts['total'] - invitation_counts['pending'] - invitation_counts['accepted']
+    )
     
     context = {
         'election': election,
         'invitations': invitations,
-        'invitation_counts': {
-            'total': total_invitations,
-            'pending': pending_invitations,
-            'accepted': accepted_invitations,
-            'declined_expired': declined_expired_invitations,
-        },
+        'invitation_counts': invitation_counts,
         'page_title': f'Manage Invitations - {election.name}'
     }
     return render(request, 'app/invitations/manage_invitations.html', context)
@@ -110,7 +109,13 @@ def manage_invitations(request, uuid):
 
 def invitation_accept(request, uuid):
     """Handle invitation acceptance/decline"""
-    invitation = get_object_or_404(Invitation, invitation_token=uuid)
+    # The response pages show most invitation and election fields, so only the keys are skipped
+    invitation = get_object_or_404(
+        Invitation.objects.select_related('election', 'invited_by').defer(
+            'election__private_key', 'election__public_key'
+        ),
+        invitation_token=uuid,
+    )
     
     # Check if invitation is still valid
     if not invitation.can_accept():
@@ -163,7 +168,9 @@ def invitation_accept(request, uuid):
 @login_required
 def resend_invitation(request, uuid):
     """Resend a specific invitation"""
-    invitation = get_object_or_404(Invitation, uuid=uuid)
+    invitation = get_object_or_404(
+        Invitation.objects.select_related('election').only(*MANAGED_INVITATION_FIELDS), uuid=uuid
+    )
     
     # Check if user can manage this election
     if not invitation.election.can_be_edited_by(request.user):
@@ -173,11 +180,9 @@ def resend_invitation(request, uuid):
         messages.error(request, "Can only resend pending invitations.")
         return redirect('manage_invitations', uuid=invitation.election.uuid)
     
-    if send_invitation_email(invitation):
-        invitation.mark_as_sent()
-        messages.success(request, f"Invitation resent to {invitation.invited_email}")
-    else:
-        messages.error(request, f"Failed to resend invitation to {invitation.invited_email}")
+    invitation_id = invitation.pk
+    transaction.on_commit(lambda: send_invitation_email_task.delay(invitation_id), robust=True)
+    messages.success(request, f"Invitation to {invitation.invited_email} is being resent.")
     
     return redirect('manage_invitations', uuid=invitation.election.uuid)
 
@@ -185,7 +190,9 @@ def resend_invitation(request, uuid):
 @login_required
 def cancel_invitation(request, uuid):
     """Cancel a pending invitation"""
-    invitation = get_object_or_404(Invitation, uuid=uuid)
+    invitation = get_object_or_404(
+        Invitation.objects.select_related('election').only(*MANAGED_INVITATION_FIELDS), uuid=uuid
+    )
     
     # Check if user can manage this election
     if not invitation.election.can_be_edited_by(request.user):
@@ -201,70 +208,29 @@ def cancel_invitation(request, uuid):
     return redirect('manage_invitations', uuid=invitation.election.uuid)
 
 
-def send_invitation_email(invitation):
-    """Send invitation email to the invited user"""
-    try:
-        # Build the invitation URL using Django sites framework
-        invitation_url = invitation.get_invitation_url()
-        current_site = Site.objects.get_current()
-        # Use https in production, http for development
-        protocol = 'https' if getattr(settings, 'USE_TLS', not settings.DEBUG) else 'http'
-        full_url = f"{protocol}://{current_site.domain}{invitation_url}"
-        
-        # Prepare email context
-        context = {
-            'invitation': invitation,
-            'election': invitation.election,
-            'invitation_url': full_url,
-            'invited_by': invitation.invited_by,
-        }
-        
-        # Render email templates
-        subject = f'Invitation to vote in "{invitation.election.name}"'
-        text_content = render_to_string('app/emails/invitation_email.txt', context)
-        html_content = render_to_string('app/emails/invitation_email.html', context)
-        
-        # Send email
-        send_mail(
-            subject=subject,
-            message=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[invitation.invited_email],
-            html_message=html_content,
-            fail_silently=False,
-        )
-        
-        return True
-        
-    except Exception as e:
-        print(f"Failed to send invitation email: {e}")
-        return False
-
-
 @login_required
 def process_pending_invitation(request):
     """Process invitation after user logs in"""
-    invitation_token = request.session.get('invitation_token')
+    # Clear the pending token up front; every outcome below consumes it
+    invitation_token = request.session.pop('invitation_token', None)
     if not invitation_token:
-        return redirect('home')
+        return redirect('index')
     
     try:
-        invitation = Invitation.objects.get(invitation_token=invitation_token)
-        if invitation.can_accept():
-            if invitation.accept(request.user):
-                messages.success(
-                    request, 
-                    f'You have successfully accepted the invitation to vote in "{invitation.election.name}".'
-                )
-                # Clear the session
-                del request.session['invitation_token']
-                return redirect('election_detail', uuid=invitation.election.uuid)
+        invitation = Invitation.objects.select_related('election').only(
+            'id', 'status', 'expires_at', 'invited_user',
+            'election__uuid', 'election__name', 'election__end_date',
+        ).get(invitation_token=invitation_token)
+        if invitation.accept(request.user):
+            messages.success(
+                request, 
+                f'You have successfully accepted the invitation to vote in "{invitation.election.name}".'
+            )
+            return redirect('election_detail', uuid=invitation.election.uuid)
         
         messages.error(request, 'Invitation is no longer valid.')
-        del request.session['invitation_token']
         
     except Invitation.DoesNotExist:
         messages.error(request, 'Invitation not found.')
-        del request.session['invitation_token']
     
-    return redirect('home')
\ No newline at end of file
+    return redirect('index')
@@ -6,11 +6,15 @@ from django.views.generic import View
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.shortcuts import render, redirect, get_object_or_404
+from django.db import IntegrityError, transaction
 from django.http import Http404
 
 from app.models import Election, Candidate, Vote
-from app.encryption import Encryption
-from app.email_utils import send_vote_confirmation
+from app.encryption import Ciphertext, Encryption
+from app.tasks import send_vote_confirmation_task
+
+# Published tally data that results verification reads from the election
+TALLY_FIELDS = ('decrypted_total', 'encrypted_positive_total', 'zero_randomness')
 
 
 class VoteView(LoginRequiredMixin, View):
@@ -19,14 +23,9 @@ class VoteView(LoginRequiredMixin, View):
     def get(self, request, uuid):
         """Display voting confirmation page"""
         try:
-            candidate = get_object_or_404(Candidate, uuid=uuid)
+            candidate = get_object_or_404(Candidate.objects.select_related('election'), uuid=uuid)
             election = candidate.election
             
-            # Verify candidate belongs to this election
-            if candidate.election != election:
-                messages.error(request, "Invalid candidate for this election.")
-                return redirect('election_detail', uuid=election.uuid)
-            
             # Check if voting is allowed
             if not election.is_voting_open():
                 messages.error(request, "Voting is not currently open for this election.")
@@ -58,16 +57,11 @@ class VoteView(LoginRequiredMixin, View):
     def post(self, request, uuid):
         """Process a vote submission"""
         try:
-            candidate = get_object_or_404(Candidate, uuid=uuid)
+            candidate = get_object_or_404(Candidate.objects.select_related('election'), uuid=uuid)
             election = candidate.election
             
-            # Verify candidate belongs to this election
-            if candidate.election != election:
-                messages.error(request, "Invalid candidate for this election.")
-                return redirect('election_detail', uuid=election.uuid)
-            
             # Validate voting conditions
-            if not self._can_vote(request.user, election, candidate):
+            if not self._can_vote(request.user, election):
                 return redirect('election_detail', uuid=election.uuid)
             
             # Create the vote with proper encryption
@@ -76,11 +70,21 @@ class VoteView(LoginRequiredMixin, View):
                 election=election
             )
             vote._candidate = candidate  # Temporary attribute for encryption
-            vote.save()  # This will trigger the encryption in the model
+            try:
+                with transaction.atomic():
+                    vote.save()  # This will trigger the encryption in the model
+            except IntegrityError:
+                # The unique (user, election) constraint is the authoritative duplicate guard
+                messages.error(request, "You have already voted in this election.")
+                return redirect('election_detail', uuid=election.uuid)
             
-            # Send confirmation email
+            # Queue the confirmation email instead of waiting on SMTP. The vote is
+            # already saved, so a broker outage is logged rather than reported.
             if request.user.email:
-                send_vote_confirmation(request.user, election)
+                user_id, election_id = request.user.pk, election.pk
+                transaction.on_commit(
+                    lambda: send_vote_confirmation_task.delay(user_id, election_id), robust=True
+                )
             
             messages.success(request, "Your vote has been recorded successfully!")
             return redirect('election_detail', uuid=election.uuid)
@@ -92,29 +96,19 @@ class VoteView(LoginRequiredMixin, View):
             messages.error(request, "An error occurred while processing your vote.")
             return redirect('election_list')
     
-    def _can_vote(self, user, election, candidate):
-        """Check if user can vote in this election for this candidate"""
+    def _can_vote(self, user, election):
+        """Check if user can vote in this election"""
         # Check if voting is open
         if not (election.is_voting_open() and election.can_vote()):
-            messages.error(user, "Voting is not currently open for this election.")
+            messages.error(self.request, "Voting is not currently open for this election.")
             return False
         
         # Check if user is authorized to vote (public election or invited to private election)
         if not election.can_user_vote(user):
             if election.is_public:
-                messages.error(user, "You are not authorized to vote in this election.")
+                messages.error(self.request, "You are not authorized to vote in this election.")
             else:
-                messages.error(user, "This is a private election. You need an invitation to vote.")
-            return False
-        
-        # Check if user already voted
-        if Vote.objects.filter(user=user, election=election).exists():
-            messages.error(user, "You have already voted in this election.")
-            return False
-        
-        # Check if candidate belongs to this election
-        if candidate.election != election:
-            messages.error(user, "Invalid candidate for this election.")
+                messages.error(self.request, "This is a private election. You need an invitation to vote.")
             return False
         
         return True
@@ -217,38 +211,28 @@ class VerifyResultsView(View):
             if not election.public_key:
                 return None  # No encryption data available
             
+            # Election does not store the published tally yet, so there is nothing to check
+            if not all(hasattr(election, field) for field in TALLY_FIELDS):
+                return None
+            
             # Parse public key
-            cleaned_key = election.public_key.replace("'", '"')
-            public_key = json.loads(cleaned_key)
+            public_key = election.parsed_public_key
             encryption = Encryption(public_key=f"{public_key['g']},{public_key['n']}")
             
-            # Convert decrypted total to negative vector
             decrypted_total = json.loads(election.decrypted_total)
-            decrypted_negative_total = [-x for x in decrypted_total]
-            
-            # Encrypt negative total
-            encrypted_negative_total = []
-            for i in decrypted_negative_total:
-                encrypted_negative_total.append(encryption.encrypt(plaintext=i, rand=1))
-            
-            # Get encrypted positive total and compute zero sum
             encrypted_positive_total = json.loads(election.encrypted_positive_total)
-            encrypted_zero_sum = []
-            
-            for i in range(len(encrypted_positive_total)):
-                from app.encryption import Ciphertext
-                temp_ept = Ciphertext.from_json(encrypted_positive_total[i])
-                encrypted_zero_sum.append(encryption.add(temp_ept, encrypted_negative_total[i]))
-            
-            # Recalculate zero sum with stored randomness
             zero_randomness = json.loads(election.zero_randomness)
-            recalculated_zero_sum = []
-            for i in range(len(zero_randomness)):
-                recalculated_zero_sum.append(encryption.encrypt(plaintext=0, rand=zero_randomness[i]))
             
-            # Verify if sums match
-            for i in range(len(encrypted_zero_sum)):
-                if encrypted_zero_sum[i].ciphertext != recalculated_zero_sum[i].ciphertext:
+            # Each positive total plus the encrypted negative decrypted total must
+            # equal an encryption of zero under the stored randomness. Stop at the
+            # first mismatch rather than encrypting the remaining entries.
+            for i in range(len(encrypted_positive_total)):
+                encrypted_negative = encryption.encrypt(plaintext=-decrypted_total[i], rand=1)
+                encrypted_zero_sum = encryption.add(
+                    Ciphertext.from_json(encrypted_positive_total[i]), encrypted_negative
+                )
+                recalculated_zero_sum = encryption.encrypt(plaintext=0, rand=zero_randomness[i])
+                if encrypted_zero_sum.ciphertext != recalculated_zero_sum.ciphertext:
                     return False
             
             return True
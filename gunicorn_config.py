@@ -11,8 +11,10 @@ bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+# Threaded workers keep serving requests while others wait on the database or SMTP
+workers = multiprocessing.cpu_count()
+worker_class = "gthread"
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
 worker_connections = 1000
 timeout = 30
 keepalive = 2
@@ -50,6 +50,12 @@ env = environ.Env(
     CSRF_COOKIE_SECURE=(bool, False),
     SECURE_BROWSER_XSS_FILTER=(bool, True),
     SECURE_CONTENT_TYPE_NOSNIFF=(bool, True),
+    # Database connection settings
+    CONN_MAX_AGE=(int, 600),
+    DISABLE_SERVER_SIDE_CURSORS=(bool, False),
+    # Celery settings
+    CELERY_BROKER_URL=(str, 'redis://localhost:6379/0'),
+    CELERY_TASK_ALWAYS_EAGER=(bool, True),
 )
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -131,10 +137,23 @@ WSGI_APPLICATION = 'project.wsgi.application'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': env.db('DATABASE_URL', default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
+}
+
+# Keep connections open between requests instead of reconnecting each time
+DATABASES['default']['CONN_MAX_AGE'] = env('CONN_MAX_AGE')
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+# Required when connecting through PgBouncer in transaction pooling mode
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = env('DISABLE_SERVER_SIDE_CURSORS')
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# The local memory default is per process; set CACHE_URL to a shared backend
+# (e.g. Redis) so homepage cache invalidation reaches every worker.
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
 }
 
 
@@ -264,4 +283,10 @@ ACCOUNT_SIGNUP_FIELDS = ['email*', 'username*', 'password1*', 'password2*']
 ENCRYPTION_KEY_PATH = env('ENCRYPTION_KEY_PATH')
 FIELD_ENCRYPTION_KEY = env('FIELD_ENCRYPTION_KEY')
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
-CRISPY_TEMPLATE_PACK = "bootstrap5"
\ No newline at end of file
+CRISPY_TEMPLATE_PACK = "bootstrap5"
+
+# Celery Configuration
+# Tasks run inline unless CELERY_TASK_ALWAYS_EAGER is disabled and a worker is running
+CELERY_BROKER_URL = env('CELERY_BROKER_URL')
+CELERY_TASK_ALWAYS_EAGER = env('CELERY_TASK_ALWAYS_EAGER')
+CELERY_TASK_IGNORE_RESULT = True
@@ -24,8 +24,13 @@ admin.site.site_header = 'Election Management System'
 admin.site.site_title = 'E-Voting'
 
 urlpatterns = [
-    # Base views
+    # Highest-traffic routes first, since patterns are matched in order
+    path('candidates/<uuid:uuid>/vote', VoteView.as_view(), name='vote'),
+    path('elections/<uuid:uuid>', ElectionDetailView.as_view(), name='election_detail'),
+    path('candidates/<uuid:uuid>', CandidateDetailView.as_view(), name='candidate_detail'),
     path('', index, name='index'),
+    
+    # Base views
     path('profile', profile, name='profile'),
     
     # Legal pages
@@ -39,19 +44,16 @@ urlpatterns = [
     # Election management
     path('elections', ElectionListView.as_view(), name='election_list'),
     path('elections/create', ElectionCreateView.as_view(), name='create_election'),
-    path('elections/<uuid:uuid>', ElectionDetailView.as_view(), name='election_detail'),
     path('elections/<uuid:uuid>/edit', ElectionUpdateView.as_view(), name='edit_election'),
     path('elections/<uuid:uuid>/close', CloseElectionView.as_view(), name='close_election'),
     path('elections/<uuid:uuid>/start', StartElectionView.as_view(), name='start_election'),
     
     # Candidate management
     path('elections/<uuid:uuid>/candidates/create', CandidateCreateView.as_view(), name='add_candidate'),
-    path('candidates/<uuid:uuid>', CandidateDetailView.as_view(), name='candidate_detail'),
     path('candidates/<uuid:uuid>/edit', CandidateUpdateView.as_view(), name='edit_candidate'),
     path('candidates/<uuid:uuid>/delete', CandidateDeleteView.as_view(), name='delete_candidate'),
     
     # Voting and results
-    path('candidates/<uuid:uuid>/vote', VoteView.as_view(), name='vote'),
     path('elections/<uuid:uuid>/verify-results', VerifyResultsView.as_view(), name='verify_results'),
     
     # Invitation management